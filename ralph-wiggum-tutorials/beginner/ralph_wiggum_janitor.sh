@@ -3,7 +3,7 @@ set -euo pipefail
 
 # --- CONFIGURATION ---
 SOURCE_DIR="."  # Current directory (Downloads)
-MODEL="opencode/gemini-3-flash"
+MODEL="${MODEL:-opencode/gemini-3-flash}"  # Override via env, e.g. a local model provider
 FAILED_LOG="ralph_failures.txt"  # Tracks files that stumped the agent
 QUARANTINE_DIR="Quarantine"  # For files that can't be processed
 
@@ -84,6 +84,16 @@ log_failure() {
     echo "${filename} | ${reason}" >> "$FAILED_LOG"
 }
 
+# Lists root-level files still waiting to be organized, one per line, sorted.
+# Skips this script, the failure log and hidden/system files.
+list_root_files() {
+    find "$SOURCE_DIR" -maxdepth 1 -type f \
+        ! -name "$(basename "$0")" \
+        ! -name "$FAILED_LOG" \
+        ! -name ".DS_Store" \
+        ! -name ".*" | sort
+}
+
 ensure_quarantine() {
     if [ ! -d "$QUARANTINE_DIR" ]; then
         mkdir -p "$QUARANTINE_DIR"
@@ -93,12 +103,13 @@ ensure_quarantine() {
 
 organize_files() {
     # 1. Load failures to avoid retrying "poison" files
-    local failed_filenames=()
+    # Kept as one newline-delimited string so each lookup is a single match
+    # instead of a loop over every failure (no associative arrays in bash 3.2)
+    local failed_filenames=$'\n'
     if [ -f "$FAILED_LOG" ]; then
         while IFS= read -r line; do
             if [ -n "$line" ]; then
-                local filename="${line%% | *}"
-                failed_filenames+=("$filename")
+                failed_filenames+="${line%% | *}"$'\n'
             fi
         done < "$FAILED_LOG"
     fi
@@ -107,22 +118,12 @@ organize_files() {
     ensure_quarantine
     
     # 3. Find and Sort files (only root-level files, skip subdirectories)
-    # Exclude common system files and the script itself
-    local temp_file
-    temp_file=$(mktemp)
-    find "$SOURCE_DIR" -maxdepth 1 -type f \
-        ! -name "digital_janitor.sh" \
-        ! -name "digital_janitor_failures.txt" \
-        ! -name ".DS_Store" \
-        ! -name ".*" | sort > "$temp_file"
-    
     local files_to_process=()
     while IFS= read -r file; do
         if [ -n "$file" ]; then
             files_to_process+=("$file")
         fi
-    done < "$temp_file"
-    rm -f "$temp_file"
+    done < <(list_root_files)
     
     local total_files=${#files_to_process[@]}
     echo "🔎 Found ${total_files} files remaining in queue."
@@ -139,20 +140,12 @@ organize_files() {
         filename=$(basename "$filepath")
         
         # Skip if we already failed on this file
-        local skip=false
-        if [ ${#failed_filenames[@]} -gt 0 ]; then
-            for failed_name in "${failed_filenames[@]}"; do
-                if [ "$filename" = "$failed_name" ]; then
-                    skip=true
-                    break
-                fi
-            done
-        fi
-        
-        if [ "$skip" = true ]; then
-            echo "⏩ Skipping known failure: ${filename}"
-            continue
-        fi
+        case "$failed_filenames" in
+            *$'\n'"$filename"$'\n'*)
+                echo "⏩ Skipping known failure: ${filename}"
+                continue
+                ;;
+        esac
         
         echo ""
         echo "[${i}/${total_files}] 🤖 Digital Janitor processing: ${filename}"
@@ -191,11 +184,7 @@ PROMPT_EOF
     
     # Count remaining files
     local remaining
-    remaining=$(find "$SOURCE_DIR" -maxdepth 1 -type f \
-        ! -name "digital_janitor.sh" \
-        ! -name "digital_janitor_failures.txt" \
-        ! -name ".DS_Store" \
-        ! -name ".*" | wc -l | tr -d ' ')
+    remaining=$(list_root_files | wc -l | tr -d ' ')
     
     if [ "$remaining" -gt 0 ]; then
         echo "📊 Remaining files in Downloads: ${remaining}"